@@ -1,7 +1,7 @@
 """Authentication module for MCP Server."""
 
 from .jwt_validator import JWTValidator, JWTClaims, jwt_validator
-from .token_verifier import Auth0TokenVerifier
+from .token_verifier import Auth0TokenVerifier, auth0_token_verifier
 from .protected_resource import (
     get_protected_resource_metadata,
     get_www_authenticate_header,
@@ -14,6 +14,7 @@ __all__ = [
     "JWTClaims",
     "jwt_validator",
     "Auth0TokenVerifier",
+    "auth0_token_verifier",
     "get_protected_resource_metadata",
     "get_www_authenticate_header",
     "get_protected_resource_routes",
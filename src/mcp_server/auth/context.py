@@ -1,10 +1,11 @@
 """Context variables for passing auth info to MCP tools."""
 
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from typing import Optional
 
 # ContextVar to store the bearer token for the current request
-# This allows MCP tools to access the token without direct access to the Starlette request
+# This allows MCP tools to access the token without direct access to the Starlette request.
+# BearerAuthMiddleware sets it once per request; code downstream should only read it.
 current_bearer_token: ContextVar[Optional[str]] = ContextVar(
     "current_bearer_token", default=None
 )
@@ -15,11 +16,16 @@ def get_current_token() -> Optional[str]:
     return current_bearer_token.get()
 
 
-def set_current_token(token: str) -> None:
-    """Set the bearer token for the current request context."""
-    current_bearer_token.set(token)
+def set_current_token(token: str) -> Token:
+    """
+    Set the bearer token for the current request context.
 
+    Returns:
+        Token to pass to reset_current_token() once the request is done
+    """
+    return current_bearer_token.set(token)
 
-def clear_current_token() -> None:
-    """Clear the bearer token for the current request context."""
-    current_bearer_token.set(None)
+
+def reset_current_token(reset_token: Token) -> None:
+    """Restore the bearer token context to its state before set_current_token()."""
+    current_bearer_token.reset(reset_token)
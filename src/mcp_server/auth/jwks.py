@@ -0,0 +1,186 @@
+"""Async JWKS cache with conditional refresh for Auth0 signing keys."""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from jwt import PyJWK
+from jwt.exceptions import InvalidTokenError, PyJWKClientConnectionError, PyJWTError
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class SigningKeyNotFoundError(InvalidTokenError):
+    """Raised when no cached signing key matches the token's kid."""
+
+
+class AsyncJWKSCache:
+    """
+    Caches signing keys from a JWKS endpoint without blocking the event loop.
+
+    - Refreshes use conditional GETs (If-None-Match / If-Modified-Since), so
+      most refreshes are answered with 304 Not Modified and no body.
+    - Freshness follows the endpoint's Cache-Control max-age.
+    - Concurrent refreshes are collapsed into a single in-flight request.
+    - Unknown kids trigger at most one refresh per cooldown window, so
+      tokens with random kids cannot be used to hammer the JWKS endpoint.
+    - Known keys are served while a stale set is revalidated in the background.
+
+    Keys are stored as parsed public-key objects (e.g. ``RSAPublicKey``) so
+    they are never re-parsed per token.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        default_max_age: float = 300,
+        refresh_cooldown: float = 10,
+    ):
+        """
+        Initialize the JWKS cache.
+
+        Args:
+            jwks_url: URL of the JWKS endpoint
+            default_max_age: Seconds to keep keys when no max-age is sent
+            refresh_cooldown: Minimum seconds between refresh attempts
+        """
+        self._jwks_url = jwks_url
+        self._default_max_age = default_max_age
+        self._refresh_cooldown = refresh_cooldown
+        self._keys: Dict[str, Any] = {}
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._expires_at = 0.0
+        self._last_refresh_attempt = float("-inf")
+        self._refreshing: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self) -> None:
+        """Initialize the HTTP client and prefetch the key set."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
+        try:
+            await self.refresh()
+        except PyJWKClientConnectionError:
+            # Not fatal (already logged): the first token will retry the fetch
+            pass
+
+    async def stop(self) -> None:
+        """Close the HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_key(self, kid: Optional[str]) -> Any:
+        """
+        Get the signing key for a kid.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            The matching public-key object, ready to pass to ``jwt.decode``
+
+        Raises:
+            SigningKeyNotFoundError: If no key matches the kid
+            PyJWKClientConnectionError: If the JWKS could never be fetched
+        """
+        if not kid:
+            raise SigningKeyNotFoundError("Token header is missing kid")
+
+        now = time.monotonic()
+        key = self._keys.get(kid)
+        cooled_down = now - self._last_refresh_attempt >= self._refresh_cooldown
+
+        if key is not None:
+            if now >= self._expires_at and cooled_down:
+                # Serve the known key and revalidate in the background
+                self._start_refresh()
+            return key
+
+        if cooled_down:
+            await self.refresh()
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise SigningKeyNotFoundError(
+                f"Unable to find a signing key that matches kid: {kid}"
+            )
+        return key
+
+    async def refresh(self) -> None:
+        """Refresh the key set, joining an in-flight refresh if there is one."""
+        await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Task:
+        """Start a refresh unless one is already in flight."""
+        if self._refreshing is None:
+            self._refreshing = asyncio.get_running_loop().create_task(self._fetch())
+            self._refreshing.add_done_callback(self._refresh_done)
+        return self._refreshing
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        """Clear the in-flight marker and surface background failures."""
+        self._refreshing = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("JWKS refresh failed: %s", task.exception())
+
+    async def _fetch(self) -> None:
+        """Fetch the JWKS, sending validators from the previous response."""
+        self._last_refresh_attempt = time.monotonic()
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
+
+        headers = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        try:
+            response = await self._client.get(self._jwks_url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+                jwks = response.json()
+                if not isinstance(jwks, dict) or not isinstance(
+                    jwks.get("keys", []), list
+                ):
+                    raise ValueError("JWKS response is not a key set")
+        except (httpx.HTTPError, ValueError) as e:
+            if not self._keys:
+                raise PyJWKClientConnectionError(
+                    f"Failed to fetch JWKS from {self._jwks_url}: {e}"
+                ) from e
+            logger.warning("JWKS refresh failed, keeping cached keys: %s", e)
+            return
+
+        if response.status_code == 200:
+            keys: Dict[str, Any] = {}
+            for jwk in jwks.get("keys", []):
+                if not isinstance(jwk, dict):
+                    continue
+                if jwk.get("use", "sig") != "sig" or not jwk.get("kid"):
+                    continue
+                try:
+                    keys[jwk["kid"]] = PyJWK(jwk).key
+                except PyJWTError as e:
+                    logger.debug("Skipping unusable JWK %s: %s", jwk.get("kid"), e)
+            self._keys = keys
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            logger.info("Loaded %s signing keys from JWKS", len(keys))
+
+        self._expires_at = time.monotonic() + self._max_age(response)
+
+    def _max_age(self, response: httpx.Response) -> float:
+        """Read the freshness lifetime from the Cache-Control header."""
+        match = _MAX_AGE_RE.search(response.headers.get("Cache-Control", ""))
+        if match:
+            return float(match.group(1))
+        return self._default_max_age
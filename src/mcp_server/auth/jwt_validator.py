@@ -1,25 +1,42 @@
 """JWT Validation using PyJWT with JWKS from Auth0."""
 
+import asyncio
+import base64
 import logging
-from dataclasses import dataclass, field
+from dataclasses import InitVar, asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
 import jwt
-from jwt import PyJWKClient
+import orjson
 from jwt.exceptions import (
+    DecodeError,
     ExpiredSignatureError,
+    InvalidAlgorithmError,
     InvalidAudienceError,
     InvalidTokenError,
 )
 
 from ..config import settings
+from .jwks import AsyncJWKSCache
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Fully-qualified custom claim names from the Ares namespace
+_EMAIL_CLAIM = f"{settings.jwt_custom_claims_namespace}email"
+_ROLE_CLAIM = f"{settings.jwt_custom_claims_namespace}role"
+_TEAMS_CLAIM = f"{settings.jwt_custom_claims_namespace}teams"
+
+
+@dataclass(slots=True)
 class JWTClaims:
-    """Parsed JWT claims with standard and custom fields."""
+    """
+    Parsed JWT claims with standard and custom fields.
+
+    ``scopes``, ``email``, ``role`` and ``teams`` are derived once at
+    construction rather than on every access. The full decoded payload is
+    only used for that projection and is not retained.
+    """
 
     sub: str
     iss: str
@@ -27,48 +44,71 @@ class JWTClaims:
     exp: int
     iat: int
     scope: Optional[str] = None
-    raw_claims: Dict[str, Any] = field(default_factory=dict)
-
-    @property
-    def scopes(self) -> List[str]:
-        """Parse scope string into list."""
-        return self.scope.split() if self.scope else []
-
-    def get_custom_claim(self, claim_name: str) -> Optional[Any]:
-        """Get custom claim from Ares namespace."""
-        namespace = settings.jwt_custom_claims_namespace
-        return self.raw_claims.get(f"{namespace}{claim_name}")
-
-    @property
-    def email(self) -> Optional[str]:
-        """Get email from custom claims."""
-        return self.get_custom_claim("email")
-
-    @property
-    def role(self) -> Optional[str]:
-        """Get role from custom claims."""
-        return self.get_custom_claim("role")
-
-    @property
-    def teams(self) -> Optional[Dict[str, Any]]:
-        """Get teams from custom claims."""
-        return self.get_custom_claim("teams")
+    raw_claims: InitVar[Optional[Dict[str, Any]]] = None
+    scopes: List[str] = field(init=False)
+    email: Optional[str] = field(init=False)
+    role: Optional[str] = field(init=False)
+    teams: Optional[Dict[str, Any]] = field(init=False)
+
+    def __post_init__(self, raw_claims: Optional[Dict[str, Any]]):
+        raw_claims = raw_claims or {}
+        self.scopes = self.scope.split() if self.scope else []
+        self.email = raw_claims.get(_EMAIL_CLAIM)
+        self.role = raw_claims.get(_ROLE_CLAIM)
+        self.teams = raw_claims.get(_TEAMS_CLAIM)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the retained claims as a dict (for debugging/logging)."""
+        return asdict(self)
+
+
+def _decode_unverified_header(token: str) -> Dict[str, Any]:
+    """Decode the JOSE header segment of a JWT without verifying it."""
+    header_segment = token.partition(".")[0]
+    try:
+        header = orjson.loads(
+            base64.urlsafe_b64decode(header_segment + "=" * (-len(header_segment) % 4))
+        )
+    except ValueError as e:
+        raise DecodeError(f"Invalid header: {e}") from e
+    if not isinstance(header, dict):
+        raise DecodeError("Invalid header: not a JSON object")
+    return header
 
 
 class JWTValidator:
     """Validates JWTs using JWKS from Auth0."""
 
     def __init__(self):
-        self._jwks_client = PyJWKClient(
-            str(settings.jwt_jwks_url),
-            cache_keys=True,
-            lifespan=300,  # Cache JWKS for 5 minutes
-        )
-
-    def validate(self, token: str) -> JWTClaims:
+        self._jwks = AsyncJWKSCache(str(settings.jwt_jwks_url))
+        self._verify_in_thread = settings.jwt_verify_in_thread
+
+        # Decode parameters are fixed at startup; bind them once
+        self._algorithms = tuple(settings.jwt_algorithms)
+        self._issuer = settings.jwt_issuer
+        self._audience = settings.jwt_audience
+        self._options = {
+            "verify_exp": True,
+            "verify_iss": True,
+            "verify_aud": True,
+            "require": ["exp", "iss", "aud", "sub"],
+        }
+
+    async def start(self) -> None:
+        """Open the JWKS client and prefetch signing keys."""
+        await self._jwks.start()
+
+    async def stop(self) -> None:
+        """Close the JWKS client."""
+        await self._jwks.stop()
+
+    async def validate(self, token: str) -> JWTClaims:
         """
         Validate JWT and return claims.
 
+        Signing keys come from the async JWKS cache, so a key refresh never
+        blocks the event loop.
+
         Args:
             token: The JWT string to validate
 
@@ -81,29 +121,22 @@ class JWTValidator:
             InvalidAudienceError: If audience doesn't match
         """
         try:
-            # Get signing key from JWKS based on token's kid header
-            signing_key = self._jwks_client.get_signing_key_from_jwt(token)
+            # Reject unexpected algorithms before touching the JWKS, then
+            # get signing key from JWKS based on token's kid header
+            header = _decode_unverified_header(token)
+            if header.get("alg") not in self._algorithms:
+                raise InvalidAlgorithmError("The specified alg value is not allowed")
+            signing_key = await self._jwks.get_key(header.get("kid"))
 
             # Decode and validate token
-            # Note: audience validation in PyJWT checks if expected audience
-            # is IN the token's aud claim (handles array aud correctly)
-            payload = jwt.decode(
-                token,
-                signing_key.key,
-                algorithms=settings.jwt_algorithms,
-                issuer=settings.jwt_issuer,
-                audience=settings.jwt_audience,
-                options={
-                    "verify_exp": True,
-                    "verify_iss": True,
-                    "verify_aud": True,
-                    "require": ["exp", "iss", "aud", "sub"],
-                },
-            )
-
-            # Handle audience as array or string
-            aud = payload.get("aud", [])
-            if isinstance(aud, str):
+            if self._verify_in_thread:
+                payload = await asyncio.to_thread(self._decode, token, signing_key)
+            else:
+                payload = self._decode(token, signing_key)
+
+            # Handle audience as array or string ("aud" is a required claim)
+            aud = payload["aud"]
+            if type(aud) is str:
                 aud = [aud]
 
             return JWTClaims(
@@ -123,9 +156,22 @@ class JWTValidator:
             logger.warning("Invalid audience in token")
             raise
         except InvalidTokenError as e:
-            logger.warning(f"Token validation failed: {e}")
+            logger.warning("Token validation failed: %s", e)
             raise
 
+    def _decode(self, token: str, key: Any) -> Dict[str, Any]:
+        """Verify the signature and standard claims, returning the payload."""
+        # Note: audience validation in PyJWT checks if expected audience
+        # is IN the token's aud claim (handles array aud correctly)
+        return jwt.decode(
+            token,
+            key,
+            algorithms=self._algorithms,
+            issuer=self._issuer,
+            audience=self._audience,
+            options=self._options,
+        )
+
 
 # Singleton instance
 jwt_validator = JWTValidator()
@@ -1,24 +1,30 @@
 """Bearer authentication middleware for protected routes."""
 
 import logging
-from typing import Callable, List, Optional
+from typing import List, Optional, Tuple
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..config import settings
-from .context import set_current_token, clear_current_token
+from .context import set_current_token, reset_current_token
 from .protected_resource import get_www_authenticate_header
-from .token_verifier import Auth0TokenVerifier
+from .token_verifier import Auth0TokenVerifier, auth0_token_verifier
 
 logger = logging.getLogger(__name__)
 
+# Prebuilt 401 response: (raw headers, body)
+_Unauthorized = Tuple[Tuple[Tuple[bytes, bytes], ...], bytes]
 
-class BearerAuthMiddleware(BaseHTTPMiddleware):
+
+class BearerAuthMiddleware:
     """
     Middleware that enforces Bearer token authentication on protected routes.
 
+    Implemented as a pure ASGI middleware: it reads the path and headers
+    straight from the scope and writes 401 responses directly to ``send``,
+    without wrapping the request in Starlette's BaseHTTPMiddleware machinery.
+
     Returns 401 with WWW-Authenticate header per RFC 9728 when:
     - No Authorization header present
     - Invalid token format
@@ -27,12 +33,12 @@ class BearerAuthMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         token_verifier: Auth0TokenVerifier = None,
         excluded_paths: List[str] = None,
     ):
-        super().__init__(app)
-        self.token_verifier = token_verifier or Auth0TokenVerifier()
+        self.app = app
+        self.token_verifier = token_verifier or auth0_token_verifier
         self.excluded_paths = excluded_paths or [
             "/.well-known/oauth-protected-resource",
             "/healthz",
@@ -42,68 +48,118 @@ class BearerAuthMiddleware(BaseHTTPMiddleware):
             "/docs",
             "/openapi.json",
         ]
+        # Exact matches are a set lookup; subpaths a single C-level startswith.
+        # Entries ending in "/" are prefix-only (e.g. "/.well-known/").
+        self._excluded_exact = frozenset(
+            p for p in self.excluded_paths if p == "/" or not p.endswith("/")
+        )
+        self._excluded_prefixes = tuple(
+            sorted(
+                {p if p.endswith("/") else p + "/" for p in self.excluded_paths}
+                - {"/", "//"}
+            )
+        )
+
+        # 401 headers and bodies never vary at runtime, so build them once
+        self._www_authenticate = get_www_authenticate_header(
+            scope=" ".join(settings.supported_scopes)
+        ).encode("latin-1")
+        self._no_token_response = self._build_unauthorized(
+            "No valid bearer token provided"
+        )
+        self._invalid_token_response = self._build_unauthorized(
+            "Invalid or expired token"
+        )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and enforce authentication on protected routes."""
-        # Skip auth for excluded paths
-        if self._is_excluded(request.url.path):
-            return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Skip auth for excluded paths before scanning any headers
+        path = scope["path"]
+        if path in self._excluded_exact or path.startswith(self._excluded_prefixes):
+            await self.app(scope, receive, send)
+            return
 
         # Extract bearer token
-        auth_header = request.headers.get("Authorization", "")
+        auth_header = b""
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+                break
         token = self._extract_bearer_token(auth_header)
 
         if not token:
-            logger.debug(f"No bearer token for path: {request.url.path}")
-            return self._unauthorized_response("No valid bearer token provided")
+            logger.debug("No bearer token for path: %s", path)
+            await self._unauthorized_response(send, self._no_token_response)
+            return
 
         # Validate token
         access_token = await self.token_verifier.verify_token(token)
 
         if not access_token:
-            logger.debug(f"Invalid token for path: {request.url.path}")
-            return self._unauthorized_response("Invalid or expired token")
+            logger.debug("Invalid token for path: %s", path)
+            await self._unauthorized_response(send, self._invalid_token_response)
+            return
 
         # Store validated token info in request state for downstream use
-        request.state.access_token = access_token
-        request.state.bearer_token = token  # Raw token for forwarding
+        state = scope.setdefault("state", {})
+        state["access_token"] = access_token
+        state["bearer_token"] = token  # Raw token for forwarding
 
         # Also store in contextvar so MCP tools can access it
         # This is necessary because FastMCP tools don't have direct access to Starlette request
-        set_current_token(token)
+        reset_token = set_current_token(token)
 
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send)
         finally:
-            # Clear the token after the request is done
-            clear_current_token()
-
-    def _is_excluded(self, path: str) -> bool:
-        """Check if path should skip authentication."""
-        # Exact match or prefix match
-        for excluded in self.excluded_paths:
-            if path == excluded or path.startswith(excluded + "/"):
-                return True
-        return False
-
-    def _extract_bearer_token(self, auth_header: str) -> Optional[str]:
-        """Extract token from 'Bearer <token>' header."""
-        if not auth_header.startswith("Bearer "):
+            # Restore the previous context once the request is done
+            reset_current_token(reset_token)
+
+    def _extract_bearer_token(self, auth_header: bytes) -> Optional[str]:
+        """
+        Extract token from a raw 'Bearer <token>' header value.
+
+        The scheme is matched case-insensitively (RFC 6750). Tokens with
+        non-ASCII bytes are rejected.
+        """
+        if auth_header[:7].lower() != b"bearer ":
+            return None
+        try:
+            return auth_header[7:].lstrip().decode("ascii")
+        except UnicodeDecodeError:
             return None
-        return auth_header[7:].strip()
 
-    def _unauthorized_response(self, detail: str) -> JSONResponse:
+    def _build_unauthorized(self, detail: str) -> _Unauthorized:
         """
-        Generate 401 response with WWW-Authenticate header per RFC 9728.
+        Build the headers and body for a 401 response with WWW-Authenticate
+        header per RFC 9728.
         """
-        scope_str = " ".join(settings.supported_scopes)
-        return JSONResponse(
-            status_code=401,
-            content={
+        body = orjson.dumps(
+            {
                 "error": "unauthorized",
                 "error_description": detail,
-            },
-            headers={
-                "WWW-Authenticate": get_www_authenticate_header(scope=scope_str),
-            },
+            }
+        )
+        headers = (
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"www-authenticate", self._www_authenticate),
+        )
+        return headers, body
+
+    async def _unauthorized_response(self, send: Send, response: _Unauthorized) -> None:
+        """
+        Send a prebuilt 401 response.
+
+        The ASGI messages are built fresh on every send, since outer
+        middleware may edit them in place.
+        """
+        headers, body = response
+        await send(
+            {"type": "http.response.start", "status": 401, "headers": list(headers)}
         )
+        await send({"type": "http.response.body", "body": body})
@@ -2,12 +2,19 @@
 
 from typing import Dict, List, Any
 
+import orjson
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
 from ..config import settings
 
+# Settings are fixed for the life of the process; snapshot the values used here
+_SERVER_URL = settings.server_url
+_SCOPES = tuple(settings.supported_scopes)
+_METADATA_URL = f"{_SERVER_URL}/.well-known/oauth-protected-resource"
+_WWW_AUTHENTICATE = f'Bearer resource_metadata="{_METADATA_URL}"'
+
 
 def get_authorization_server_metadata() -> Dict[str, Any]:
     """
@@ -20,11 +27,11 @@ def get_authorization_server_metadata() -> Dict[str, Any]:
         dict: Metadata document for the authorization server
     """
     return {
-        "issuer": settings.server_url,
-        "authorization_endpoint": f"{settings.server_url}/oauth/authorize",
-        "token_endpoint": f"{settings.server_url}/oauth/token",
-        "registration_endpoint": f"{settings.server_url}/register",
-        "scopes_supported": settings.supported_scopes,
+        "issuer": _SERVER_URL,
+        "authorization_endpoint": f"{_SERVER_URL}/oauth/authorize",
+        "token_endpoint": f"{_SERVER_URL}/oauth/token",
+        "registration_endpoint": f"{_SERVER_URL}/register",
+        "scopes_supported": list(_SCOPES),
         "response_types_supported": ["code"],
         "response_modes_supported": ["query"],
         "grant_types_supported": ["authorization_code", "refresh_token"],
@@ -33,16 +40,15 @@ def get_authorization_server_metadata() -> Dict[str, Any]:
     }
 
 
-async def authorization_server_metadata_endpoint(request: Request) -> JSONResponse:
+async def authorization_server_metadata_endpoint(request: Request) -> Response:
     """
     Handle GET /.well-known/oauth-authorization-server requests.
 
     Per RFC 8414, returns metadata about the authorization server
     including endpoints for authorization and token exchange.
     """
-    metadata = get_authorization_server_metadata()
-    return JSONResponse(
-        content=metadata,
+    return Response(
+        content=_AUTHORIZATION_SERVER_METADATA_BODY,
         media_type="application/json",
     )
 
@@ -58,29 +64,33 @@ def get_protected_resource_metadata() -> Dict[str, Any]:
         dict: Metadata document for the protected resource
     """
     return {
-        "resource": settings.server_url,
+        "resource": _SERVER_URL,
         # Point to our own server which proxies the auth server metadata
-        "authorization_servers": [settings.server_url],
-        "scopes_supported": settings.supported_scopes,
+        "authorization_servers": [_SERVER_URL],
+        "scopes_supported": list(_SCOPES),
         "bearer_methods_supported": ["header"],
-        "resource_documentation": f"{settings.server_url}/docs",
+        "resource_documentation": f"{_SERVER_URL}/docs",
     }
 
 
-async def protected_resource_metadata_endpoint(request: Request) -> JSONResponse:
+async def protected_resource_metadata_endpoint(request: Request) -> Response:
     """
     Handle GET /.well-known/oauth-protected-resource requests.
 
     Per RFC 9728, returns metadata about this protected resource
     including which authorization servers can issue tokens for it.
     """
-    metadata = get_protected_resource_metadata()
-    return JSONResponse(
-        content=metadata,
+    return Response(
+        content=_PROTECTED_RESOURCE_METADATA_BODY,
         media_type="application/json",
     )
 
 
+# Metadata only depends on settings, so serialize it once at import time
+_AUTHORIZATION_SERVER_METADATA_BODY = orjson.dumps(get_authorization_server_metadata())
+_PROTECTED_RESOURCE_METADATA_BODY = orjson.dumps(get_protected_resource_metadata())
+
+
 def get_protected_resource_routes() -> List[Route]:
     """Return routes for RFC 9728 Protected Resource Metadata and RFC 8414 Authorization Server Metadata."""
     return [
@@ -111,11 +121,6 @@ def get_www_authenticate_header(scope: str = None) -> str:
     Returns:
         str: WWW-Authenticate header value
     """
-    metadata_url = f"{settings.server_url}/.well-known/oauth-protected-resource"
-
-    header_value = f'Bearer resource_metadata="{metadata_url}"'
-
     if scope:
-        header_value += f' scope="{scope}"'
-
-    return header_value
+        return f'{_WWW_AUTHENTICATE} scope="{scope}"'
+    return _WWW_AUTHENTICATE
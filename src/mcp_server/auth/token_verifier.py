@@ -5,7 +5,10 @@ from typing import Optional
 
 from jwt.exceptions import InvalidTokenError
 
+from ..config import settings
+from .jwks import SigningKeyNotFoundError
 from .jwt_validator import JWTClaims, jwt_validator
+from .verification_cache import InvalidTokenCache, ValidTokenCache, token_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +16,8 @@ logger = logging.getLogger(__name__)
 class AccessTokenInfo:
     """Information about a validated access token."""
 
+    __slots__ = ("token", "client_id", "scopes", "expires_at", "claims")
+
     def __init__(
         self,
         token: str,
@@ -44,8 +49,25 @@ class Auth0TokenVerifier:
 
     This class provides token verification for the MCP server,
     validating JWT signatures, expiration, issuer, and audience.
+    Successfully validated tokens are cached so repeat requests with the
+    same bearer token skip signature verification, and rejected tokens are
+    remembered briefly so clients replaying a bad token do not trigger a
+    verification per retry.
+
+    The verifier is stateful (it owns the verification caches), so use
+    the shared ``auth0_token_verifier`` instance rather than creating new ones.
     """
 
+    def __init__(self):
+        self._cache = ValidTokenCache(
+            maxsize=settings.jwt_cache_maxsize,
+            max_ttl=settings.jwt_cache_ttl,
+        )
+        self._bad_tokens = InvalidTokenCache(
+            maxsize=settings.jwt_negative_cache_maxsize,
+            ttl=settings.jwt_negative_cache_ttl,
+        )
+
     async def verify_token(self, token: str) -> Optional[AccessTokenInfo]:
         """
         Verify a bearer token and return AccessTokenInfo if valid.
@@ -56,35 +78,18 @@ class Auth0TokenVerifier:
         Returns:
             AccessTokenInfo if valid, None if invalid
         """
-        try:
-            claims: JWTClaims = jwt_validator.validate(token)
-
-            return AccessTokenInfo(
-                token=token,
-                client_id=claims.sub,
-                scopes=claims.scopes,
-                expires_at=claims.exp,
-                claims=claims,
-            )
+        key = token_cache_key(token)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
 
-        except InvalidTokenError as e:
-            logger.debug(f"Token verification failed: {e}")
+        if key in self._bad_tokens:
             return None
 
-    def verify_token_sync(self, token: str) -> Optional[AccessTokenInfo]:
-        """
-        Synchronous version of verify_token.
-
-        Args:
-            token: The bearer token (JWT) to verify
-
-        Returns:
-            AccessTokenInfo if valid, None if invalid
-        """
         try:
-            claims: JWTClaims = jwt_validator.validate(token)
+            claims: JWTClaims = await jwt_validator.validate(token)
 
-            return AccessTokenInfo(
+            access_token = AccessTokenInfo(
                 token=token,
                 client_id=claims.sub,
                 scopes=claims.scopes,
@@ -93,5 +98,16 @@ class Auth0TokenVerifier:
             )
 
         except InvalidTokenError as e:
-            logger.debug(f"Token verification failed: {e}")
+            logger.debug("Token verification failed: %s", e)
+            # An unknown kid may be a key rotation the JWKS cache has not
+            # picked up yet, so only remember definitive failures
+            if not isinstance(e, SigningKeyNotFoundError):
+                self._bad_tokens.add(key)
             return None
+
+        self._cache.put(key, access_token, expires_at=claims.exp)
+        return access_token
+
+
+# Singleton instance
+auth0_token_verifier = Auth0TokenVerifier()
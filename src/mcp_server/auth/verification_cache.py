@@ -0,0 +1,117 @@
+"""Bounded caches of token verification results."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def token_cache_key(token: str) -> bytes:
+    """
+    Compute the cache key for a raw token.
+
+    Caches are keyed by a BLAKE2b digest so the raw token is never kept as a
+    key and key size is fixed regardless of token length.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+class ValidTokenCache:
+    """
+    Bounded LRU cache of validated tokens.
+
+    Entries expire at the earlier of the caller-supplied expiry (the token's
+    own ``exp`` claim) and ``max_ttl`` seconds after insertion. Expired
+    entries are evicted lazily on lookup. Failures are never stored here.
+
+    Lookups and inserts contain no await points, so they are atomic with
+    respect to other tasks on the event loop and need no lock.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_ttl: float = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached tokens
+            max_ttl: Maximum seconds an entry is served from cache
+        """
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+        self._maxsize = maxsize
+        self._max_ttl = max_ttl
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        Get a cached value if present and not expired.
+
+        Args:
+            key: Cache key from ``token_cache_key``
+
+        Returns:
+            The cached value, or None on miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: Any, expires_at: float) -> None:
+        """
+        Cache a validated token, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from ``token_cache_key``
+            value: The verification result to cache
+            expires_at: Unix time the token itself expires
+        """
+        expires_at = min(expires_at, time.time() + self._max_ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class InvalidTokenCache:
+    """
+    Bounded cache of recently rejected tokens.
+
+    Lets clients that replay the same expired or malformed token be
+    rejected with a dict lookup instead of a full verification.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 30):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of remembered tokens
+            ttl: Seconds a rejected token is remembered
+        """
+        # Token key -> monotonic time the entry expires
+        self._entries: OrderedDict[bytes, float] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def __contains__(self, key: bytes) -> bool:
+        """Check whether a token was rejected within the TTL."""
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False
+        return True
+
+    def add(self, key: bytes) -> None:
+        """Remember a rejected token, evicting the oldest entry if full."""
+        self._entries[key] = time.monotonic() + self._ttl
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -35,6 +35,28 @@ class Settings(BaseSettings):
     jwt_algorithms: List[str] = ["RS256"]
     jwt_custom_claims_namespace: str = "https://ares/"
 
+    # Validated token cache (skips signature verification for repeat tokens)
+    jwt_cache_ttl: int = Field(
+        default=300,
+        description="Maximum seconds a validated token is served from cache",
+    )
+    jwt_cache_maxsize: int = Field(
+        default=1024,
+        description="Maximum number of validated tokens kept in cache",
+    )
+    jwt_negative_cache_ttl: int = Field(
+        default=30,
+        description="Seconds a rejected token is rejected without re-verifying",
+    )
+    jwt_negative_cache_maxsize: int = Field(
+        default=512,
+        description="Maximum number of rejected tokens kept in cache",
+    )
+    jwt_verify_in_thread: bool = Field(
+        default=False,
+        description="Verify JWT signatures in a worker thread instead of the event loop",
+    )
+
     # OAuth Scopes
     supported_scopes: List[str] = ["openid", "profile", "email", "offline_access"]
 
@@ -51,6 +73,16 @@ class Settings(BaseSettings):
         default="http://localhost:8000/auth/callback",
         description="OAuth redirect URI for fallback auth endpoints",
     )
+    oauth_state_max_size: int = Field(
+        default=10_000,
+        description="Maximum pending OAuth states kept in memory (oldest are evicted)",
+    )
+
+    # Dynamic Client Registration (RFC 7591) in-memory store
+    max_registered_clients: int = Field(
+        default=10_000,
+        description="Maximum number of dynamically registered clients kept in memory",
+    )
 
     # Trace ID header name (required by Ares)
     trace_id_header: str = "Trace-Id"
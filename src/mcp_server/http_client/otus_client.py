@@ -63,7 +63,7 @@ class OtusClient:
             raise RuntimeError("OtusClient not initialized. Call start() first.")
 
         url = settings.otus_teams_url
-        logger.debug(f"Fetching teams from Otus: {url}")
+        logger.debug("Fetching teams from Otus: %s", url)
 
         try:
             response = await self._client.get(
@@ -90,11 +90,11 @@ class OtusClient:
             return response.text
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Otus API error: {e.response.status_code}")
+            logger.error("Otus API error: %s", e.response.status_code)
             raise OtusClientError(
                 e.response.status_code,
                 e.response.text or str(e),
             )
         except httpx.RequestError as e:
-            logger.error(f"Otus request failed: {e}")
+            logger.error("Otus request failed: %s", e)
             raise OtusClientError(502, f"Failed to connect to Otus: {e}")
@@ -1,21 +1,29 @@
 """Application entry point - creates and configures the Starlette application."""
 
+import asyncio
+import contextlib
+import hashlib
 import logging
+import ssl
 from contextlib import asynccontextmanager
 
+import httpx
+import orjson
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Mount, Route
 
+from .auth.jwt_validator import jwt_validator
 from .auth.middleware import BearerAuthMiddleware
 from .auth.protected_resource import get_protected_resource_routes
-from .auth.token_verifier import Auth0TokenVerifier
+from .auth.token_verifier import auth0_token_verifier
 from .config import settings
 from .oauth.client_registration import get_client_registration_routes
 from .oauth.proxy import get_oauth_proxy_routes
 from .oauth.routes import get_oauth_routes
+from .oauth.state import oauth_state_store
 from .server import create_mcp_server
 
 # Configure logging
@@ -30,6 +38,22 @@ mcp_server = None
 otus_client = None
 
 
+def _log_hash_backend() -> None:
+    """
+    Log which implementation backs hashlib.sha256 (used for PKCE S256).
+
+    OpenSSL dispatches to SHA-NI on CPUs that have it. CPython's builtin
+    fallback is correct but several times slower, so warn when it is in use.
+    """
+    if hashlib.sha256.__module__ == "_hashlib":
+        logger.info("SHA-256 backend: %s", ssl.OPENSSL_VERSION)
+    else:
+        logger.warning(
+            "SHA-256 backend: builtin (Python not linked against OpenSSL); "
+            "PKCE hashing will be slower"
+        )
+
+
 @asynccontextmanager
 async def lifespan(app):
     """Application lifespan handler for startup/shutdown."""
@@ -37,12 +61,27 @@ async def lifespan(app):
 
     # Startup
     logger.info("Starting MCP OAuth Server...")
-    logger.info(f"Server URL: {settings.server_url}")
-    logger.info(f"Auth Server: {settings.auth_server_issuer}")
+    logger.info("Server URL: %s", settings.server_url)
+    logger.info("Auth Server: %s", settings.auth_server_issuer)
+    _log_hash_backend()
 
     # Note: mcp_server and otus_client are created in create_app() before this runs
     # We only need to start the otus_client and initialize the MCP session manager
     await otus_client.start()
+    await jwt_validator.start()
+
+    # Shared client for outbound calls to the authorization server (Ares),
+    # so OAuth endpoints reuse pooled connections instead of a new TLS
+    # handshake per request. HTTP/2 is negotiated via ALPN, multiplexing
+    # concurrent calls over one connection; HTTP/1.1 servers still work.
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=2.0),
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    )
+
+    # Sweep expired OAuth states from abandoned auth flows
+    state_cleanup_task = asyncio.create_task(oauth_state_store.run_cleanup_loop())
 
     # Initialize MCP session manager - required when embedding in Starlette
     # See: https://github.com/modelcontextprotocol/python-sdk/issues/737
@@ -52,50 +91,61 @@ async def lifespan(app):
 
     # Shutdown
     logger.info("Shutting down MCP OAuth Server...")
+    state_cleanup_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await state_cleanup_task
+    await app.state.http.aclose()
     await otus_client.stop()
+    await jwt_validator.stop()
     logger.info("Shutdown complete")
 
 
-async def healthz(request: Request) -> JSONResponse:
+# Static endpoint payloads, serialized once at import
+_HEALTHZ_BYTES = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": "oauth-mcp-server",
+        "version": "0.1.0",
+    }
+)
+
+_ROOT_BYTES = orjson.dumps(
+    {
+        "name": "OAuth MCP Server",
+        "version": "0.1.0",
+        "description": "MCP Server acting as OAuth 2.1 Protected Resource",
+        "endpoints": {
+            "health": "/healthz",
+            "protected_resource_metadata": "/.well-known/oauth-protected-resource",
+            "authorization_server_metadata": "/.well-known/oauth-authorization-server",
+            "client_registration": "/register",
+            "oauth_authorize": "/oauth/authorize",
+            "oauth_token": "/oauth/token",
+            "mcp": "/mcp",
+            "auth_start": "/auth/start",
+            "auth_callback": "/auth/callback",
+            "auth_refresh": "/auth/refresh",
+        },
+    }
+)
+
+
+async def healthz(request: Request) -> Response:
     """
     Health check endpoint.
 
     Returns 200 OK if the server is running.
     """
-    return JSONResponse(
-        content={
-            "status": "healthy",
-            "service": "oauth-mcp-server",
-            "version": "0.1.0",
-        }
-    )
+    return Response(content=_HEALTHZ_BYTES, media_type="application/json")
 
 
-async def root(request: Request) -> JSONResponse:
+async def root(request: Request) -> Response:
     """
     Root endpoint with server information.
 
     Provides links to important endpoints.
     """
-    return JSONResponse(
-        content={
-            "name": "OAuth MCP Server",
-            "version": "0.1.0",
-            "description": "MCP Server acting as OAuth 2.1 Protected Resource",
-            "endpoints": {
-                "health": "/healthz",
-                "protected_resource_metadata": "/.well-known/oauth-protected-resource",
-                "authorization_server_metadata": "/.well-known/oauth-authorization-server",
-                "client_registration": "/register",
-                "oauth_authorize": "/oauth/authorize",
-                "oauth_token": "/oauth/token",
-                "mcp": "/mcp",
-                "auth_start": "/auth/start",
-                "auth_callback": "/auth/callback",
-                "auth_refresh": "/auth/refresh",
-            },
-        }
-    )
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 def create_app() -> Starlette:
@@ -111,11 +161,17 @@ def create_app() -> Starlette:
     mcp_server, otus_client = create_mcp_server()
 
     # Define routes
+    # Starlette matches routes by scanning this list in order, so the
+    # highest-traffic paths come first
     routes = [
-        # Root endpoint
-        Route("/", endpoint=root, methods=["GET"]),
+        # MCP Streamable HTTP transport (protected by middleware)
+        # Note: streamable_http_app() is the recommended transport as of MCP spec 2025-03-26
+        # SSE is deprecated but kept for backward compatibility
+        Mount("/mcp", app=mcp_server.streamable_http_app()),
         # Health check (unprotected)
         Route("/healthz", endpoint=healthz, methods=["GET"]),
+        # Root endpoint
+        Route("/", endpoint=root, methods=["GET"]),
         # RFC 9728 Protected Resource Metadata (unprotected)
         *get_protected_resource_routes(),
         # RFC 7591 Dynamic Client Registration (unprotected)
@@ -124,37 +180,35 @@ def create_app() -> Starlette:
         *get_oauth_proxy_routes(),
         # Fallback OAuth endpoints (unprotected)
         *get_oauth_routes(),
-        # MCP Streamable HTTP transport (protected by middleware)
-        # Note: streamable_http_app() is the recommended transport as of MCP spec 2025-03-26
-        # SSE is deprecated but kept for backward compatibility
-        Mount("/mcp", app=mcp_server.streamable_http_app()),
+    ]
+
+    # Authentication middleware (pure ASGI)
+    # The middleware will skip authentication for excluded paths
+    middleware = [
+        Middleware(
+            BearerAuthMiddleware,
+            token_verifier=auth0_token_verifier,
+            excluded_paths=[
+                "/",
+                "/.well-known/",
+                "/healthz",
+                "/register",
+                "/oauth/authorize",
+                "/oauth/token",
+                "/auth/start",
+                "/auth/callback",
+                "/auth/refresh",
+            ],
+        ),
     ]
 
     # Create application with lifespan handler
     app = Starlette(
         routes=routes,
+        middleware=middleware,
         lifespan=lifespan,
     )
 
-    # Add authentication middleware
-    # The middleware will skip authentication for excluded paths
-    app.add_middleware(
-        BearerAuthMiddleware,
-        token_verifier=Auth0TokenVerifier(),
-        excluded_paths=[
-            "/",
-            "/.well-known/oauth-protected-resource",
-            "/.well-known/oauth-authorization-server",
-            "/healthz",
-            "/register",
-            "/oauth/authorize",
-            "/oauth/token",
-            "/auth/start",
-            "/auth/callback",
-            "/auth/refresh",
-        ],
-    )
-
     return app
 
 
@@ -2,10 +2,11 @@
 
 from .routes import get_oauth_routes
 from .pkce import generate_pkce_pair
-from .state import oauth_state_store
+from .state import OAuthStateEntry, oauth_state_store
 
 __all__ = [
     "get_oauth_routes",
     "generate_pkce_pair",
+    "OAuthStateEntry",
     "oauth_state_store",
 ]
@@ -1,15 +1,18 @@
 """RFC 7591 OAuth 2.0 Dynamic Client Registration implementation."""
 
 import secrets
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
 from ..config import settings
+from ..responses import ORJSONResponse
 
 
 class ClientRegistrationRequest(BaseModel):
@@ -54,7 +57,11 @@ class ClientRegistrationResponse(BaseModel):
 
 
 # In-memory client store (for POC - use a database in production)
-_registered_clients: Dict[str, Dict[str, Any]] = {}
+# Bounded LRU so registration churn cannot grow memory without limit;
+# registrations also expire after a year, like client secrets.
+_registered_clients: "OrderedDict[str, ClientRegistrationResponse]" = OrderedDict()
+_registered_clients_lock = threading.Lock()
+_CLIENT_TTL_SECONDS = 365 * 24 * 60 * 60
 
 
 def generate_client_id() -> str:
@@ -82,7 +89,7 @@ def register_client(request_data: ClientRegistrationRequest) -> ClientRegistrati
     if request_data.token_endpoint_auth_method != "none":
         client_secret = secrets.token_urlsafe(32)
         # Secret expires in 1 year
-        secret_expires_at = issued_at + (365 * 24 * 60 * 60)
+        secret_expires_at = issued_at + _CLIENT_TTL_SECONDS
 
     # Build response
     response = ClientRegistrationResponse(
@@ -100,12 +107,15 @@ def register_client(request_data: ClientRegistrationRequest) -> ClientRegistrati
     )
 
     # Store client (in production, persist to database)
-    _registered_clients[client_id] = response.model_dump()
+    with _registered_clients_lock:
+        _registered_clients[client_id] = response
+        while len(_registered_clients) > settings.max_registered_clients:
+            _registered_clients.popitem(last=False)
 
     return response
 
 
-async def client_registration_endpoint(request: Request) -> JSONResponse:
+async def client_registration_endpoint(request: Request) -> Response:
     """
     Handle POST /register requests for dynamic client registration.
 
@@ -113,17 +123,19 @@ async def client_registration_endpoint(request: Request) -> JSONResponse:
     dynamically without manual intervention.
     """
     try:
-        body = await request.json()
-        registration_request = ClientRegistrationRequest(**body)
+        # Parse and validate in one pass with pydantic's JSON parser
+        registration_request = ClientRegistrationRequest.model_validate_json(
+            await request.body()
+        )
         response = register_client(registration_request)
 
-        return JSONResponse(
-            content=response.model_dump(exclude_none=True),
+        return Response(
+            content=response.model_dump_json(exclude_none=True),
             status_code=201,
             media_type="application/json",
         )
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": "invalid_client_metadata",
                 "error_description": str(e),
@@ -152,6 +164,14 @@ def get_registered_client(client_id: str) -> Optional[Dict[str, Any]]:
         client_id: The client ID to look up
 
     Returns:
-        Client data if found, None otherwise
+        Client data if found and not expired, None otherwise
     """
-    return _registered_clients.get(client_id)
+    with _registered_clients_lock:
+        client = _registered_clients.get(client_id)
+        if client is None:
+            return None
+        if client.client_id_issued_at + _CLIENT_TTL_SECONDS <= time.time():
+            del _registered_clients[client_id]
+            return None
+        _registered_clients.move_to_end(client_id)
+    return client.model_dump()
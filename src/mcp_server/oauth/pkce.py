@@ -1,10 +1,17 @@
 """PKCE (Proof Key for Code Exchange) utilities for OAuth 2.1."""
 
 import base64
+import binascii
 import hashlib
+import re
 import secrets
 from typing import Tuple
 
+# An S256 challenge is always 43 unpadded base64url characters. The last one
+# carries only 4 digest bits, so its 2 low bits must be zero: anything else is
+# a non-canonical encoding that would decode to the same digest.
+_CHALLENGE_RE = re.compile(r"[A-Za-z0-9_-]{42}[AEIMQUYcgkosw048]")
+
 
 def generate_pkce_pair() -> Tuple[str, str]:
     """
@@ -19,8 +26,11 @@ def generate_pkce_pair() -> Tuple[str, str]:
     Returns:
         Tuple of (code_verifier, code_challenge)
     """
-    # Generate random code_verifier (43-128 chars, using 64 for good entropy)
-    code_verifier = secrets.token_urlsafe(64)[:128]
+    # Generate random code_verifier: 32 random bytes (256 bits) encode to
+    # exactly 43 chars, the RFC 7636 minimum length
+    code_verifier = (
+        base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b"=").decode("ascii")
+    )
 
     # Generate code_challenge using S256
     # SHA256 hash, then Base64url encode without padding
@@ -41,6 +51,14 @@ def verify_pkce(code_verifier: str, code_challenge: str) -> bool:
     Returns:
         True if the verifier produces the same challenge, False otherwise
     """
+    # Compare raw digests: decode the challenge once instead of encoding
+    # the computed digest. b64decode would also accept "+" and "/" and ignore
+    # the unused low bits, so the canonical form is checked up front.
+    if not _CHALLENGE_RE.fullmatch(code_challenge):
+        return False
+    try:
+        expected = base64.b64decode(code_challenge + "=", altchars=b"-_", validate=True)
+    except (binascii.Error, ValueError):
+        return False
     digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
-    computed_challenge = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
-    return secrets.compare_digest(computed_challenge, code_challenge)
+    return secrets.compare_digest(digest, expected)
@@ -1,19 +1,54 @@
 """OAuth proxy endpoints to translate standard OAuth flow to Ares API."""
 
 import logging
-import uuid
-from typing import List
+import secrets
+from typing import Any, Dict, List
 
 import httpx
+import orjson
 from starlette.requests import Request
-from starlette.responses import JSONResponse, RedirectResponse
+from starlette.responses import RedirectResponse, Response
 from starlette.routing import Route
 
 from ..config import settings
-from .state import oauth_state_store
+from ..responses import ORJSONResponse
+from .state import OAuthStateEntry, oauth_state_store
+from .urls import ensure_state_param
 
 logger = logging.getLogger(__name__)
 
+# Ares endpoints and headers, bound once at import
+_AUTHORIZE_URL = settings.auth_server_authorize_url
+_TOKEN_URL = settings.auth_server_token_url
+_REFRESH_URL = settings.auth_server_refresh_url
+_TRACE_HEADER = settings.trace_id_header
+
+# Fixed error bodies, serialized once at import
+_UNSUPPORTED_RESPONSE_TYPE_BODY = orjson.dumps(
+    {
+        "error": "unsupported_response_type",
+        "error_description": "Only 'code' response_type is supported",
+    }
+)
+_MISSING_REDIRECT_URI_BODY = orjson.dumps(
+    {
+        "error": "invalid_request",
+        "error_description": "Missing redirect_uri or state",
+    }
+)
+_NO_REDIRECT_URL_BODY = orjson.dumps(
+    {
+        "error": "server_error",
+        "error_description": "No redirect_url from authorization server",
+    }
+)
+_INVALID_REQUEST_BODY = orjson.dumps(
+    {
+        "error": "invalid_request",
+        "error_description": "Invalid request body",
+    }
+)
+
 
 async def oauth_authorize_proxy(request: Request) -> RedirectResponse:
     """
@@ -42,89 +77,150 @@ async def oauth_authorize_proxy(request: Request) -> RedirectResponse:
 
     # Validate required params
     if response_type != "code":
-        return JSONResponse(
+        return Response(
+            content=_UNSUPPORTED_RESPONSE_TYPE_BODY,
             status_code=400,
-            content={
-                "error": "unsupported_response_type",
-                "error_description": "Only 'code' response_type is supported",
-            },
+            media_type="application/json",
         )
 
     if not redirect_uri or not state:
-        return JSONResponse(
+        return Response(
+            content=_MISSING_REDIRECT_URI_BODY,
             status_code=400,
-            content={
-                "error": "invalid_request",
-                "error_description": "Missing redirect_uri or state",
-            },
+            media_type="application/json",
         )
 
     # Store the original request params for the token exchange
     oauth_state_store.save(
         state,
-        {
-            "client_id": client_id,
-            "redirect_uri": redirect_uri,
-            "code_challenge": code_challenge,
-            "code_challenge_method": code_challenge_method,
-            "scope": scope,
-        },
+        OAuthStateEntry(
+            client_id=client_id,
+            redirect_uri=redirect_uri,
+            code_challenge=code_challenge,
+            code_challenge_method=code_challenge_method,
+            scope=scope,
+        ),
     )
 
     # Generate trace ID for Ares
-    trace_id = str(uuid.uuid4())
+    trace_id = secrets.token_hex(16)
 
     # Call Ares /authorize endpoint (POST) to get the redirect URL
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                settings.auth_server_authorize_url,
-                params={"callback_url": redirect_uri},
-                headers={settings.trace_id_header: trace_id},
-            )
-            response.raise_for_status()
-            data = response.json()
-            auth_url = data.get("redirect_url")
-
-            if not auth_url:
-                logger.error(f"Ares response missing redirect_url: {data}")
-                return JSONResponse(
-                    status_code=500,
-                    content={
-                        "error": "server_error",
-                        "error_description": "No redirect_url from authorization server",
-                    },
-                )
-
-            # Ensure state is in the redirect URL for CSRF protection
-            if "state=" not in auth_url:
-                separator = "&" if "?" in auth_url else "?"
-                auth_url = f"{auth_url}{separator}state={state}"
-
-            logger.info(f"Redirecting to auth provider: {auth_url[:100]}...")
-            return RedirectResponse(url=auth_url, status_code=302)
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Ares authorize error: {e.response.status_code} - {e.response.text}")
-            return JSONResponse(
-                status_code=e.response.status_code,
-                content={
-                    "error": "authorization_error",
-                    "error_description": f"Authorization server error: {e.response.text}",
-                },
-            )
-        except Exception as e:
-            logger.error(f"Failed to proxy authorize request: {e}")
-            return JSONResponse(
+    client = request.app.state.http
+    try:
+        response = await client.post(
+            _AUTHORIZE_URL,
+            params={"callback_url": redirect_uri},
+            headers={_TRACE_HEADER: trace_id},
+        )
+        response.raise_for_status()
+        data = response.json()
+        auth_url = data.get("redirect_url")
+
+        if not auth_url:
+            logger.error("Ares response missing redirect_url: %s", data)
+            return Response(
+                content=_NO_REDIRECT_URL_BODY,
                 status_code=500,
-                content={
-                    "error": "server_error",
-                    "error_description": str(e),
-                },
+                media_type="application/json",
             )
 
+        # Ensure state is in the redirect URL for CSRF protection
+        auth_url = ensure_state_param(auth_url, state)
+
+        logger.info("Redirecting to auth provider: %s...", auth_url[:100])
+        return RedirectResponse(url=auth_url, status_code=302)
+
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            "Ares authorize error: %s - %s", e.response.status_code, e.response.text
+        )
+        return ORJSONResponse(
+            status_code=e.response.status_code,
+            content={
+                "error": "authorization_error",
+                "error_description": f"Authorization server error: {e.response.text}",
+            },
+        )
+    except Exception as e:
+        logger.error("Failed to proxy authorize request: %s", e)
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": "server_error",
+                "error_description": str(e),
+            },
+        )
+
+
+_TOKEN_PARAMS = (
+    "grant_type",
+    "code",
+    "redirect_uri",
+    "client_id",
+    "code_verifier",
+    "refresh_token",
+)
+
+
+async def _extract_token_params(request: Request) -> Dict[str, Any]:
+    """
+    Read token request parameters from a form-urlencoded or JSON body.
+
+    Raises:
+        ValueError: If a JSON body is malformed or not an object
+    """
+    content_type = request.headers.get("content-type", "")
+
+    if "application/x-www-form-urlencoded" in content_type:
+        data = await request.form()
+    else:
+        data = orjson.loads(await request.body())
+        if not isinstance(data, dict):
+            raise ValueError("Token request body must be a JSON object")
+
+    return {name: data.get(name) for name in _TOKEN_PARAMS}
+
+
+async def _exchange_code(
+    client: httpx.AsyncClient, params: Dict[str, Any], trace_id: str
+) -> httpx.Response:
+    """Exchange an authorization code for tokens via Ares /login endpoint."""
+    return await client.post(
+        _TOKEN_URL,
+        params={
+            "code": params["code"],
+            "callback_url": params["redirect_uri"],
+        },
+        headers={
+            _TRACE_HEADER: trace_id,
+            "Content-Type": "application/json",
+        },
+    )
+
+
+async def _refresh_tokens(
+    client: httpx.AsyncClient, params: Dict[str, Any], trace_id: str
+) -> httpx.Response:
+    """Refresh tokens via Ares /refresh_token endpoint."""
+    return await client.post(
+        _REFRESH_URL,
+        json={"refresh_token": params["refresh_token"]},
+        headers={
+            _TRACE_HEADER: trace_id,
+            "Content-Type": "application/json",
+        },
+    )
+
+
+# Supported grant types -> Ares request for that grant
+_GRANT_HANDLERS = {
+    "authorization_code": _exchange_code,
+    "refresh_token": _refresh_tokens,
+}
+
 
-async def oauth_token_proxy(request: Request) -> JSONResponse:
+async def oauth_token_proxy(request: Request) -> Response:
     """
     POST /oauth/token - Proxy for OAuth token endpoint.
 
@@ -138,114 +234,72 @@ async def oauth_token_proxy(request: Request) -> JSONResponse:
         code_verifier: PKCE verifier (for authorization_code grant)
         refresh_token: Refresh token (for refresh_token grant)
     """
-    # Parse form data or JSON
-    content_type = request.headers.get("content-type", "")
+    try:
+        params = await _extract_token_params(request)
+    except ValueError:
+        return Response(
+            content=_INVALID_REQUEST_BODY,
+            status_code=400,
+            media_type="application/json",
+        )
 
-    if "application/x-www-form-urlencoded" in content_type:
-        form_data = await request.form()
-        grant_type = form_data.get("grant_type")
-        code = form_data.get("code")
-        redirect_uri = form_data.get("redirect_uri")
-        client_id = form_data.get("client_id")
-        code_verifier = form_data.get("code_verifier")
-        refresh_token = form_data.get("refresh_token")
-    else:
-        try:
-            body = await request.json()
-            grant_type = body.get("grant_type")
-            code = body.get("code")
-            redirect_uri = body.get("redirect_uri")
-            client_id = body.get("client_id")
-            code_verifier = body.get("code_verifier")
-            refresh_token = body.get("refresh_token")
-        except Exception:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": "invalid_request",
-                    "error_description": "Invalid request body",
-                },
-            )
+    grant_type = params["grant_type"]
+    handler = _GRANT_HANDLERS.get(grant_type) if isinstance(grant_type, str) else None
+    if handler is None:
+        return ORJSONResponse(
+            status_code=400,
+            content={
+                "error": "unsupported_grant_type",
+                "error_description": f"Grant type '{grant_type}' not supported",
+            },
+        )
 
     # Generate trace ID for Ares
-    trace_id = str(uuid.uuid4())
-
-    async with httpx.AsyncClient() as client:
-        try:
-            if grant_type == "authorization_code":
-                # Exchange code for tokens via Ares /login endpoint
-                response = await client.post(
-                    settings.auth_server_token_url,
-                    params={
-                        "code": code,
-                        "callback_url": redirect_uri,
-                    },
-                    headers={
-                        settings.trace_id_header: trace_id,
-                        "Content-Type": "application/json",
-                    },
-                )
-
-            elif grant_type == "refresh_token":
-                # Refresh tokens via Ares /refresh_token endpoint
-                response = await client.post(
-                    settings.auth_server_refresh_url,
-                    json={"refresh_token": refresh_token},
-                    headers={
-                        settings.trace_id_header: trace_id,
-                        "Content-Type": "application/json",
-                    },
-                )
-
-            else:
-                return JSONResponse(
-                    status_code=400,
-                    content={
-                        "error": "unsupported_grant_type",
-                        "error_description": f"Grant type '{grant_type}' not supported",
-                    },
-                )
-
-            if response.status_code != 200:
-                error_data = response.json() if response.content else {}
-                logger.error(f"Ares token error: {response.status_code} - {error_data}")
-                return JSONResponse(
-                    status_code=response.status_code,
-                    content={
-                        "error": error_data.get("error", "token_error"),
-                        "error_description": error_data.get("error_message", response.text),
-                    },
-                )
-
-            # Return tokens in standard OAuth format
-            tokens = response.json()
-
-            # Ensure response has standard OAuth fields
-            oauth_response = {
-                "access_token": tokens.get("access_token"),
-                "token_type": tokens.get("token_type", "Bearer"),
-                "expires_in": tokens.get("expires_in", 3600),
-            }
-
-            if tokens.get("refresh_token"):
-                oauth_response["refresh_token"] = tokens["refresh_token"]
-            if tokens.get("id_token"):
-                oauth_response["id_token"] = tokens["id_token"]
-            if tokens.get("scope"):
-                oauth_response["scope"] = tokens["scope"]
-
-            return JSONResponse(content=oauth_response)
-
-        except Exception as e:
-            logger.error(f"Token proxy error: {e}")
-            return JSONResponse(
-                status_code=500,
+    trace_id = secrets.token_hex(16)
+
+    try:
+        response = await handler(request.app.state.http, params, trace_id)
+
+        if response.status_code != 200:
+            error_data = response.json() if response.content else {}
+            logger.error("Ares token error: %s - %s", response.status_code, error_data)
+            return ORJSONResponse(
+                status_code=response.status_code,
                 content={
-                    "error": "server_error",
-                    "error_description": str(e),
+                    "error": error_data.get("error", "token_error"),
+                    "error_description": error_data.get("error_message", response.text),
                 },
             )
 
+        # Return tokens in standard OAuth format
+        tokens = orjson.loads(response.content)
+
+        # Ensure response has standard OAuth fields
+        oauth_response = {
+            "access_token": tokens.get("access_token"),
+            "token_type": tokens.get("token_type", "Bearer"),
+            "expires_in": tokens.get("expires_in", 3600),
+        }
+
+        if tokens.get("refresh_token"):
+            oauth_response["refresh_token"] = tokens["refresh_token"]
+        if tokens.get("id_token"):
+            oauth_response["id_token"] = tokens["id_token"]
+        if tokens.get("scope"):
+            oauth_response["scope"] = tokens["scope"]
+
+        return ORJSONResponse(oauth_response)
+
+    except Exception as e:
+        logger.error("Token proxy error: %s", e)
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": "server_error",
+                "error_description": str(e),
+            },
+        )
+
 
 def get_oauth_proxy_routes() -> List[Route]:
     """Return routes for OAuth proxy endpoints."""
@@ -2,21 +2,62 @@
 
 import logging
 import secrets
-import uuid
 from typing import List
 from urllib.parse import urlencode
 
 import httpx
+import orjson
 from starlette.requests import Request
-from starlette.responses import JSONResponse, RedirectResponse
+from starlette.responses import RedirectResponse, Response
 from starlette.routing import Route
 
 from ..config import settings
+from ..responses import ORJSONResponse
 from .pkce import generate_pkce_pair
-from .state import oauth_state_store
+from .state import OAuthStateEntry, oauth_state_store
+from .urls import ensure_state_param
 
 logger = logging.getLogger(__name__)
 
+# Ares endpoints and headers, bound once at import
+_AUTHORIZE_URL = settings.auth_server_authorize_url
+_TOKEN_URL = settings.auth_server_token_url
+_REFRESH_URL = settings.auth_server_refresh_url
+_TRACE_HEADER = settings.trace_id_header
+_REDIRECT_URI = settings.oauth_redirect_uri
+
+# Fixed error bodies, serialized once at import
+_NO_REDIRECT_URL_BODY = orjson.dumps(
+    {
+        "error": "server_error",
+        "error_description": "No redirect_url from Ares",
+    }
+)
+_MISSING_CODE_OR_STATE_BODY = orjson.dumps(
+    {
+        "error": "invalid_request",
+        "error_description": "Missing code or state parameter",
+    }
+)
+_INVALID_STATE_BODY = orjson.dumps(
+    {
+        "error": "invalid_state",
+        "error_description": "State not found or expired",
+    }
+)
+_INVALID_JSON_BODY = orjson.dumps(
+    {
+        "error": "invalid_request",
+        "error_description": "Invalid JSON body",
+    }
+)
+_MISSING_REFRESH_TOKEN_BODY = orjson.dumps(
+    {
+        "error": "invalid_request",
+        "error_description": "Missing refresh_token in body",
+    }
+)
+
 
 async def auth_start(request: Request) -> RedirectResponse:
     """
@@ -35,62 +76,57 @@ async def auth_start(request: Request) -> RedirectResponse:
     state = secrets.token_urlsafe(32)
 
     # Determine callback URL
-    callback_url = request.query_params.get("callback_url", settings.oauth_redirect_uri)
+    callback_url = request.query_params.get("callback_url", _REDIRECT_URI)
 
     # Store state and code_verifier for callback
     oauth_state_store.save(
         state,
-        {
-            "code_verifier": code_verifier,
-            "callback_url": callback_url,
-        },
+        OAuthStateEntry(code_verifier=code_verifier, callback_url=callback_url),
     )
 
     # Generate trace ID for Ares
-    trace_id = str(uuid.uuid4())
+    trace_id = secrets.token_hex(16)
 
     # Call Ares /authorize endpoint to get the redirect URL
     # Ares returns a JSON with redirect_url, not a direct redirect
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                settings.auth_server_authorize_url,
-                params={"callback_url": callback_url},
-                headers={settings.trace_id_header: trace_id},
-            )
-            response.raise_for_status()
-            data = response.json()
-            auth_url = data.get("redirect_url")
-
-            if not auth_url:
-                return JSONResponse(
-                    status_code=500,
-                    content={"error": "server_error", "error_description": "No redirect_url from Ares"},
-                )
-
-            # Add state to the URL (Ares might not include it)
-            # Parse and modify the URL to ensure state is included
-            if "state=" not in auth_url:
-                separator = "&" if "?" in auth_url else "?"
-                auth_url = f"{auth_url}{separator}state={state}"
-
-            return RedirectResponse(url=auth_url, status_code=302)
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Ares authorize error: {e.response.text}")
-            return JSONResponse(
-                status_code=e.response.status_code,
-                content={"error": "authorization_error", "error_description": str(e)},
-            )
-        except Exception as e:
-            logger.error(f"Failed to initiate auth: {e}")
-            return JSONResponse(
+    client = request.app.state.http
+    try:
+        response = await client.post(
+            _AUTHORIZE_URL,
+            params={"callback_url": callback_url},
+            headers={_TRACE_HEADER: trace_id},
+        )
+        response.raise_for_status()
+        data = response.json()
+        auth_url = data.get("redirect_url")
+
+        if not auth_url:
+            return Response(
+                content=_NO_REDIRECT_URL_BODY,
                 status_code=500,
-                content={"error": "server_error", "error_description": str(e)},
+                media_type="application/json",
             )
 
+        # Add state to the URL (Ares might not include it)
+        auth_url = ensure_state_param(auth_url, state)
 
-async def auth_callback(request: Request) -> JSONResponse:
+        return RedirectResponse(url=auth_url, status_code=302)
+
+    except httpx.HTTPStatusError as e:
+        logger.error("Ares authorize error: %s", e.response.text)
+        return ORJSONResponse(
+            status_code=e.response.status_code,
+            content={"error": "authorization_error", "error_description": str(e)},
+        )
+    except Exception as e:
+        logger.error("Failed to initiate auth: %s", e)
+        return ORJSONResponse(
+            status_code=500,
+            content={"error": "server_error", "error_description": str(e)},
+        )
+
+
+async def auth_callback(request: Request) -> Response:
     """
     GET /auth/callback - Handles OAuth callback with code exchange.
 
@@ -108,7 +144,7 @@ async def auth_callback(request: Request) -> JSONResponse:
     error = request.query_params.get("error")
 
     if error:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "error": error,
@@ -117,137 +153,128 @@ async def auth_callback(request: Request) -> JSONResponse:
         )
 
     if not code or not state:
-        return JSONResponse(
+        return Response(
+            content=_MISSING_CODE_OR_STATE_BODY,
             status_code=400,
-            content={
-                "error": "invalid_request",
-                "error_description": "Missing code or state parameter",
-            },
+            media_type="application/json",
         )
 
     # Retrieve stored state data without consuming it (allows retries on errors)
     state_data = oauth_state_store.peek(state)
     if not state_data:
-        return JSONResponse(
+        return Response(
+            content=_INVALID_STATE_BODY,
             status_code=400,
-            content={
-                "error": "invalid_state",
-                "error_description": "State not found or expired",
-            },
+            media_type="application/json",
         )
 
-    callback_url = state_data["callback_url"]
+    callback_url = state_data.callback_url
 
     # Generate trace ID for Ares
-    trace_id = str(uuid.uuid4())
+    trace_id = secrets.token_hex(16)
 
     # Exchange code for tokens via Ares /login endpoint
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                settings.auth_server_token_url,
-                params={
-                    "code": code,
-                    "callback_url": callback_url,
-                },
-                headers={
-                    settings.trace_id_header: trace_id,
-                    "Content-Type": "application/json",
-                },
-            )
+    client = request.app.state.http
+    try:
+        response = await client.post(
+            _TOKEN_URL,
+            params={
+                "code": code,
+                "callback_url": callback_url,
+            },
+            headers={
+                _TRACE_HEADER: trace_id,
+                "Content-Type": "application/json",
+            },
+        )
 
-            if response.status_code != 200:
-                # Error in token exchange - don't consume state to allow retries
-                error_data = response.json() if response.content else {}
-                return JSONResponse(
-                    status_code=response.status_code,
-                    content={
-                        "error": error_data.get("error_message", "token_exchange_failed"),
-                        "error_description": error_data.get("error_message", response.text),
-                    },
-                )
-
-            # Success! Now consume the state to prevent replay attacks
-            oauth_state_store.consume(state)
-
-            # Return tokens
-            tokens = response.json()
-            return JSONResponse(content=tokens)
-
-        except Exception as e:
-            logger.error(f"Token exchange failed: {e}")
-            return JSONResponse(
-                status_code=500,
+        if response.status_code != 200:
+            # Error in token exchange - don't consume state to allow retries
+            error_data = response.json() if response.content else {}
+            return ORJSONResponse(
+                status_code=response.status_code,
                 content={
-                    "error": "server_error",
-                    "error_description": str(e),
+                    "error": error_data.get("error_message", "token_exchange_failed"),
+                    "error_description": error_data.get("error_message", response.text),
                 },
             )
 
+        # Success! Now consume the state to prevent replay attacks
+        oauth_state_store.consume(state)
 
-async def auth_refresh(request: Request) -> JSONResponse:
+        # Return Ares' token JSON as-is, without a parse/serialize round trip
+        return Response(content=response.content, media_type="application/json")
+
+    except Exception as e:
+        logger.error("Token exchange failed: %s", e)
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": "server_error",
+                "error_description": str(e),
+            },
+        )
+
+
+async def auth_refresh(request: Request) -> Response:
     """
     POST /auth/refresh - Refreshes access token using refresh_token.
 
     Body: { "refresh_token": "..." }
     """
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         refresh_token = body.get("refresh_token")
     except Exception:
-        return JSONResponse(
+        return Response(
+            content=_INVALID_JSON_BODY,
             status_code=400,
-            content={
-                "error": "invalid_request",
-                "error_description": "Invalid JSON body",
-            },
+            media_type="application/json",
         )
 
     if not refresh_token:
-        return JSONResponse(
+        return Response(
+            content=_MISSING_REFRESH_TOKEN_BODY,
             status_code=400,
-            content={
-                "error": "invalid_request",
-                "error_description": "Missing refresh_token in body",
-            },
+            media_type="application/json",
         )
 
     # Generate trace ID for Ares
-    trace_id = str(uuid.uuid4())
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                settings.auth_server_refresh_url,
-                json={"refresh_token": refresh_token},
-                headers={
-                    settings.trace_id_header: trace_id,
-                    "Content-Type": "application/json",
-                },
-            )
+    trace_id = secrets.token_hex(16)
 
-            if response.status_code != 200:
-                error_data = response.json() if response.content else {}
-                return JSONResponse(
-                    status_code=response.status_code,
-                    content={
-                        "error": error_data.get("error_message", "refresh_failed"),
-                        "error_description": error_data.get("error_message", response.text),
-                    },
-                )
-
-            return JSONResponse(content=response.json())
-
-        except Exception as e:
-            logger.error(f"Token refresh failed: {e}")
-            return JSONResponse(
-                status_code=500,
+    client = request.app.state.http
+    try:
+        response = await client.post(
+            _REFRESH_URL,
+            json={"refresh_token": refresh_token},
+            headers={
+                _TRACE_HEADER: trace_id,
+                "Content-Type": "application/json",
+            },
+        )
+
+        if response.status_code != 200:
+            error_data = response.json() if response.content else {}
+            return ORJSONResponse(
+                status_code=response.status_code,
                 content={
-                    "error": "server_error",
-                    "error_description": str(e),
+                    "error": error_data.get("error_message", "refresh_failed"),
+                    "error_description": error_data.get("error_message", response.text),
                 },
             )
 
+        return Response(content=response.content, media_type="application/json")
+
+    except Exception as e:
+        logger.error("Token refresh failed: %s", e)
+        return ORJSONResponse(
+            status_code=500,
+            content={
+                "error": "server_error",
+                "error_description": str(e),
+            },
+        )
+
 
 def get_oauth_routes() -> List[Route]:
     """Return routes for fallback OAuth endpoints."""
@@ -1,8 +1,47 @@
 """OAuth state management for PKCE flow."""
 
+import asyncio
+import logging
 import threading
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, kw_only=True)
+class OAuthStateEntry:
+    """
+    Data kept for a pending OAuth flow, keyed by its state parameter.
+
+    The proxy flow fills the client's request fields; the fallback flow
+    fills code_verifier and callback_url. ``expires_at`` is set by the store.
+    """
+
+    client_id: Optional[str] = None
+    redirect_uri: Optional[str] = None
+    code_challenge: Optional[str] = None
+    code_challenge_method: Optional[str] = None
+    scope: Optional[str] = None
+    code_verifier: Optional[str] = None
+    callback_url: Optional[str] = None
+    expires_at: float = 0.0
+
+
+class _StateShard:
+    """One partition of the state store, guarded by its own lock."""
+
+    __slots__ = ("store", "lock")
+
+    def __init__(self):
+        # state -> entry. Every state gets the same TTL, so insertion
+        # order is also expiry order: soonest first.
+        self.store: OrderedDict[str, OAuthStateEntry] = OrderedDict()
+        self.lock = threading.Lock()
 
 
 class OAuthStateStore:
@@ -12,32 +51,66 @@ class OAuthStateStore:
     States expire after a configurable TTL (default 10 minutes).
     States are single-use and deleted after successful token exchange
     to allow retries on errors while maintaining security.
+
+    States are partitioned by hash into independent shards, each with its
+    own lock, so concurrent OAuth flows rarely contend on the same lock.
+    Expired states are evicted by a background sweep (run_cleanup_loop)
+    that runs shortly after new states are saved, keeping request-path
+    lock hold times constant.
+
+    The store is bounded: once a shard holds its share of ``max_size``
+    states, saving a new state evicts that shard's oldest one, so floods
+    of abandoned authorize requests cannot grow memory without limit.
     """
 
-    def __init__(self, ttl_minutes: int = 10):
+    def __init__(
+        self, ttl_minutes: int = 10, num_shards: int = 16, max_size: int = 10_000
+    ):
         """
         Initialize the state store.
 
         Args:
             ttl_minutes: Time-to-live for states in minutes
+            num_shards: Number of independently locked shards (power of two)
+            max_size: Maximum number of states kept across all shards
         """
-        self._store: Dict[str, tuple[datetime, Dict[str, Any]]] = {}
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._lock = threading.Lock()
-
-    def save(self, state: str, data: Dict[str, Any]) -> None:
+        if num_shards < 1 or num_shards & (num_shards - 1):
+            raise ValueError(f"num_shards must be a power of two, got {num_shards}")
+        self._shards = tuple(_StateShard() for _ in range(num_shards))
+        self._shard_mask = num_shards - 1
+        self._ttl_seconds = ttl_minutes * 60.0
+        self._shard_max_size = max(1, -(-max_size // num_shards))
+        # Set by save() to wake the sweeper; save() runs on the event loop
+        # (from the OAuth route handlers), where Event.set() is safe
+        self._sweep_needed = asyncio.Event()
+
+    def _shard(self, state: str) -> _StateShard:
+        """Get the shard that owns a state."""
+        return self._shards[hash(state) & self._shard_mask]
+
+    def save(self, state: str, entry: OAuthStateEntry) -> None:
         """
-        Save state data with timestamp.
+        Save state data, stamping its expiry time.
 
         Args:
             state: The state parameter (unique identifier)
-            data: Data to associate with the state
+            entry: Data to associate with the state
         """
-        with self._lock:
-            self._cleanup()
-            self._store[state] = (datetime.utcnow(), data)
+        shard = self._shard(state)
+        with shard.lock:
+            # Expiry is taken under the lock so the shard stays expiry-ordered
+            entry.expires_at = time.monotonic() + self._ttl_seconds
+            store = shard.store
+            store[state] = entry
+            store.move_to_end(state)
 
-    def peek(self, state: str) -> Optional[Dict[str, Any]]:
+            if len(store) > self._shard_max_size:
+                store.popitem(last=False)
+                logger.warning("OAuth state store full, evicted oldest pending state")
+
+        self._sweep_needed.set()
+
+    def peek(self, state: str) -> Optional[OAuthStateEntry]:
         """
         Get state data without consuming it (for validation/retry scenarios).
 
@@ -51,12 +124,11 @@ class OAuthStateStore:
         Returns:
             The associated data if found and not expired, None otherwise
         """
-        with self._lock:
-            self._cleanup()
-            if state in self._store:
-                timestamp, data = self._store[state]
-                if datetime.utcnow() - timestamp < self._ttl:
-                    return data
+        # A single dict lookup is atomic under the GIL, so reads skip the
+        # lock; consume() remains the authority on single use
+        entry = self._shard(state).store.get(state)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            return entry
         return None
 
     def consume(self, state: str) -> bool:
@@ -72,13 +144,13 @@ class OAuthStateStore:
         Returns:
             True if the state was found and consumed, False otherwise
         """
-        with self._lock:
-            if state in self._store:
-                del self._store[state]
-                return True
-        return False
+        # Removal stays under the shard lock: a sweep may swap in a
+        # compacted dict, and a pop on the old one would be lost
+        shard = self._shard(state)
+        with shard.lock:
+            return shard.store.pop(state, None) is not None
 
-    def get(self, state: str) -> Optional[Dict[str, Any]]:
+    def get(self, state: str) -> Optional[OAuthStateEntry]:
         """
         Get and delete state data if not expired (single-use).
 
@@ -92,25 +164,71 @@ class OAuthStateStore:
         Returns:
             The associated data if found and not expired, None otherwise
         """
-        with self._lock:
-            self._cleanup()
-            if state in self._store:
-                timestamp, data = self._store.pop(state)
-                if datetime.utcnow() - timestamp < self._ttl:
-                    return data
+        shard = self._shard(state)
+        with shard.lock:
+            entry = shard.store.pop(state, None)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            return entry
         return None
 
-    def _cleanup(self) -> None:
-        """Remove expired entries."""
-        now = datetime.utcnow()
-        expired = [
-            key
-            for key, (timestamp, _) in self._store.items()
-            if now - timestamp >= self._ttl
-        ]
-        for key in expired:
-            del self._store[key]
+    def cleanup(self) -> None:
+        """Remove expired entries from every shard."""
+        for shard in self._shards:
+            with shard.lock:
+                self._cleanup(shard)
+
+    async def run_cleanup_loop(
+        self, interval: float = 60, min_interval: float = 1.0
+    ) -> None:
+        """
+        Remove expired entries in the background until cancelled.
+
+        The loop sleeps until a state is saved, or for ``interval`` seconds
+        when the store is idle. After each sweep it waits ``min_interval``
+        seconds, so saves in that window are coalesced into one sweep.
+
+        This is the only place expired entries are evicted; reads still
+        check expiry themselves, so correctness does not depend on the
+        sweep cadence.
+
+        Args:
+            interval: Maximum seconds between sweeps
+            min_interval: Minimum seconds between sweeps
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._sweep_needed.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._sweep_needed.clear()
+            self.cleanup()
+            await asyncio.sleep(min_interval)
+
+    def _cleanup(self, shard: _StateShard) -> None:
+        """
+        Remove expired entries from a shard. Caller must hold its lock.
+
+        The shard is ordered by expiry, so this pops from the front until
+        it reaches a live state: the cost is proportional to the number of
+        expired entries, not the shard size.
+
+        Dicts never shrink on delete, so when a sweep removes most of a
+        shard (e.g. after a burst of abandoned flows) the dict is rebuilt
+        to release the slots left behind.
+        """
+        now = time.monotonic()
+        store = shard.store
+        removed = 0
+        for entry in store.values():
+            if entry.expires_at > now:
+                break
+            removed += 1
+        for _ in range(removed):
+            store.popitem(last=False)
+
+        if removed > len(store):
+            shard.store = OrderedDict(store)
 
 
 # Singleton instance
-oauth_state_store = OAuthStateStore()
+oauth_state_store = OAuthStateStore(max_size=settings.oauth_state_max_size)
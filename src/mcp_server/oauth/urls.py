@@ -0,0 +1,25 @@
+"""URL helpers for OAuth redirects."""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+def ensure_state_param(url: str, state: str) -> str:
+    """
+    Add a state query parameter to a URL unless it already has one.
+
+    The existing query string is kept byte-for-byte; state is appended.
+
+    Args:
+        url: Authorization URL returned by the authorization server
+        state: The state parameter to add
+
+    Returns:
+        The URL with a state query parameter
+    """
+    parts = urlsplit(url)
+    if any(key == "state" for key, _ in parse_qsl(parts.query, keep_blank_values=True)):
+        return url
+
+    state_param = urlencode({"state": state})
+    query = f"{parts.query}&{state_param}" if parts.query else state_param
+    return urlunsplit(parts._replace(query=query))
@@ -13,6 +13,28 @@ from .tools.otus_teams import register_tools
 
 logger = logging.getLogger(__name__)
 
+# Configure transport security to allow our production host
+# See: https://github.com/modelcontextprotocol/python-sdk/issues/1798
+# e.g., "oauth-mcpserver-poc.onrender.com"
+_SERVER_HOST = urlparse(settings.server_url).netloc
+
+_TRANSPORT_SECURITY = TransportSecuritySettings(
+    enable_dns_rebinding_protection=True,
+    allowed_hosts=[
+        "localhost:*",
+        "127.0.0.1:*",
+        _SERVER_HOST,
+        f"{_SERVER_HOST}:*",
+    ],
+    allowed_origins=[
+        "http://localhost:*",
+        "https://localhost:*",
+        f"https://{_SERVER_HOST}",
+        "https://claude.ai",
+        "https://claude.com",
+    ],
+)
+
 
 def create_mcp_server() -> Tuple[FastMCP, OtusClient]:
     """
@@ -31,33 +53,10 @@ def create_mcp_server() -> Tuple[FastMCP, OtusClient]:
     #
     # streamable_http_path="/" ensures endpoints are at the root of the mount point
     # so when mounted at /mcp, endpoints are at /mcp instead of /mcp/mcp
-    #
-    # Configure transport security to allow our production host
-    # See: https://github.com/modelcontextprotocol/python-sdk/issues/1798
-    parsed_url = urlparse(settings.server_url)
-    server_host = parsed_url.netloc  # e.g., "oauth-mcpserver-poc.onrender.com"
-
-    transport_security = TransportSecuritySettings(
-        enable_dns_rebinding_protection=True,
-        allowed_hosts=[
-            "localhost:*",
-            "127.0.0.1:*",
-            f"{server_host}",
-            f"{server_host}:*",
-        ],
-        allowed_origins=[
-            "http://localhost:*",
-            "https://localhost:*",
-            f"https://{server_host}",
-            "https://claude.ai",
-            "https://claude.com",
-        ],
-    )
-
     mcp = FastMCP(
         name="oauth-mcp-server",
         streamable_http_path="/",
-        transport_security=transport_security,
+        transport_security=_TRANSPORT_SECURITY,
     )
 
     # Create HTTP client for Otus
@@ -1,6 +1,7 @@
 """MCP Tool implementation for Otus teams endpoint."""
 
 import logging
+import time
 
 from mcp.server.fastmcp import FastMCP
 
@@ -9,6 +10,17 @@ from ..http_client.otus_client import OtusClient, OtusClientError
 
 logger = logging.getLogger(__name__)
 
+# Otus status codes with a dedicated message for MCP clients
+_ERROR_MESSAGES = {
+    401: "Token is invalid or expired",
+    403: "Insufficient permissions to access teams",
+}
+
+
+async def ping() -> str:
+    """Simple ping tool for testing connectivity (timestamp in ns since the epoch)."""
+    return f"pong - {time.time_ns()}"
+
 
 def register_tools(mcp: FastMCP, otus_client: OtusClient) -> None:
     """
@@ -19,19 +31,6 @@ def register_tools(mcp: FastMCP, otus_client: OtusClient) -> None:
         otus_client: The Otus API client
     """
 
-    @mcp.tool(
-        name="ping",
-        description="Simple ping tool to test MCP connectivity. Returns 'pong' with a timestamp.",
-    )
-    async def ping() -> str:
-        """Simple ping tool for testing connectivity."""
-        import datetime
-        return f"pong - {datetime.datetime.now().isoformat()}"
-
-    @mcp.tool(
-        name="otus_teams",
-        description="Retrieve teams from the Otus API. Returns a list of teams the authenticated user has access to.",
-    )
     async def otus_teams() -> str:
         """
         Retrieve teams from the Otus API.
@@ -64,11 +63,23 @@ def register_tools(mcp: FastMCP, otus_client: OtusClient) -> None:
             return result
 
         except OtusClientError as e:
-            logger.error(f"Failed to fetch teams from Otus: {e}")
+            logger.error("Failed to fetch teams from Otus: %s", e)
             # Re-raise with appropriate error for MCP
-            if e.status_code == 401:
-                raise ValueError("Token is invalid or expired") from e
-            elif e.status_code == 403:
-                raise ValueError("Insufficient permissions to access teams") from e
-            else:
-                raise ValueError(f"Otus API error: {e.message}") from e
+            message = _ERROR_MESSAGES.get(e.status_code)
+            raise ValueError(message or f"Otus API error: {e.message}") from e
+
+    # (handler, name, description) for every tool this server exposes
+    tools = (
+        (
+            ping,
+            "ping",
+            "Simple ping tool to test MCP connectivity. Returns 'pong' with a timestamp.",
+        ),
+        (
+            otus_teams,
+            "otus_teams",
+            "Retrieve teams from the Otus API. Returns a list of teams the authenticated user has access to.",
+        ),
+    )
+    for handler, name, description in tools:
+        mcp.add_tool(handler, name=name, description=description)
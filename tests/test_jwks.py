@@ -0,0 +1,138 @@
+"""Tests for the async JWKS cache."""
+
+import asyncio
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from jwt.exceptions import PyJWKClientConnectionError
+
+from mcp_server.auth.jwks import AsyncJWKSCache, SigningKeyNotFoundError
+
+JWKS_URL = "https://tenant.example.com/.well-known/jwks.json"
+
+
+def _jwk(kid: str) -> dict:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    return {**jwk, "kid": kid, "use": "sig", "alg": "RS256"}
+
+
+@pytest.fixture(scope="module")
+def jwks() -> dict:
+    return {"keys": [_jwk("key-1")]}
+
+
+@pytest.fixture
+async def cache():
+    cache = AsyncJWKSCache(JWKS_URL)
+    yield cache
+    await cache.stop()
+
+
+async def test_concurrent_get_key_shares_one_fetch(respx_mock, cache, jwks):
+    route = respx_mock.get(JWKS_URL).mock(return_value=httpx.Response(200, json=jwks))
+
+    keys = await asyncio.gather(*(cache.get_key("key-1") for _ in range(10)))
+
+    assert route.call_count == 1
+    assert all(key is keys[0] for key in keys)
+
+
+async def test_unknown_kid_within_cooldown_does_not_refetch(respx_mock, jwks):
+    route = respx_mock.get(JWKS_URL).mock(return_value=httpx.Response(200, json=jwks))
+    cache = AsyncJWKSCache(JWKS_URL, refresh_cooldown=60)
+    await cache.start()
+    try:
+        for _ in range(3):
+            with pytest.raises(SigningKeyNotFoundError):
+                await cache.get_key("unknown")
+        assert await cache.get_key("key-1") is not None
+    finally:
+        await cache.stop()
+
+    assert route.call_count == 1
+
+
+async def test_not_modified_keeps_existing_keys(respx_mock, cache, jwks):
+    route = respx_mock.get(JWKS_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=jwks, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+    )
+    await cache.start()
+    key = await cache.get_key("key-1")
+
+    await cache.refresh()
+
+    assert route.call_count == 2
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+    assert await cache.get_key("key-1") is key
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        httpx.Response(200, json=[1]),
+        httpx.Response(200, json={"keys": {"kid": "key-1"}}),
+        httpx.Response(200, content=b"not json"),
+        httpx.Response(503),
+        httpx.ConnectError("connection refused"),
+    ],
+)
+async def test_failed_refresh_keeps_existing_keys(respx_mock, cache, jwks, failure):
+    respx_mock.get(JWKS_URL).mock(
+        side_effect=[httpx.Response(200, json=jwks), failure]
+    )
+    await cache.start()
+    key = await cache.get_key("key-1")
+
+    await cache.refresh()
+
+    assert await cache.get_key("key-1") is key
+
+
+async def test_cold_start_with_unreachable_jwks_raises(respx_mock):
+    respx_mock.get(JWKS_URL).mock(side_effect=httpx.ConnectError("connection refused"))
+    cache = AsyncJWKSCache(JWKS_URL, refresh_cooldown=0)
+    try:
+        # Startup tolerates the failure so the server can still come up
+        await cache.start()
+
+        with pytest.raises(PyJWKClientConnectionError):
+            await cache.get_key("key-1")
+    finally:
+        await cache.stop()
+
+
+async def test_max_age_sets_freshness(respx_mock, jwks):
+    route = respx_mock.get(JWKS_URL).mock(
+        return_value=httpx.Response(
+            200, json=jwks, headers={"Cache-Control": "public, max-age=600"}
+        )
+    )
+    cache = AsyncJWKSCache(JWKS_URL, default_max_age=0, refresh_cooldown=0)
+    try:
+        await cache.start()
+        await cache.get_key("key-1")
+        await asyncio.sleep(0)
+    finally:
+        await cache.stop()
+
+    # Still fresh per max-age, so no background revalidation was started
+    assert route.call_count == 1
+
+
+async def test_stale_key_is_served_while_revalidating(respx_mock, jwks):
+    route = respx_mock.get(JWKS_URL).mock(return_value=httpx.Response(200, json=jwks))
+    cache = AsyncJWKSCache(JWKS_URL, default_max_age=0, refresh_cooldown=0)
+    try:
+        await cache.start()
+        assert await cache.get_key("key-1") is not None
+        await cache.refresh()
+    finally:
+        await cache.stop()
+
+    assert route.call_count == 2
@@ -0,0 +1,50 @@
+"""Tests for PKCE utilities."""
+
+import base64
+import hashlib
+
+from mcp_server.oauth.pkce import generate_pkce_pair, verify_pkce
+
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def test_generated_pair_verifies():
+    code_verifier, code_challenge = generate_pkce_pair()
+    assert verify_pkce(code_verifier, code_challenge)
+
+
+def test_wrong_verifier_is_rejected():
+    _, code_challenge = generate_pkce_pair()
+    other_verifier, _ = generate_pkce_pair()
+    assert not verify_pkce(other_verifier, code_challenge)
+
+
+def test_rfc7636_example():
+    # RFC 7636 Appendix B
+    assert verify_pkce(
+        "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk",
+        "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM",
+    )
+
+
+def test_non_canonical_challenge_is_rejected():
+    code_verifier, code_challenge = generate_pkce_pair()
+    last = _ALPHABET.index(code_challenge[-1])
+    # Setting the 2 unused low bits still decodes to the same digest
+    for low_bits in (1, 2, 3):
+        variant = code_challenge[:-1] + _ALPHABET[last | low_bits]
+        assert not verify_pkce(code_verifier, variant)
+
+
+def test_standard_base64_alphabet_is_rejected():
+    code_verifier = "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"
+    digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
+    standard = base64.b64encode(digest).rstrip(b"=").decode("ascii")
+    assert "+" in standard or "/" in standard
+    assert not verify_pkce(code_verifier, standard)
+
+
+def test_padded_or_truncated_challenge_is_rejected():
+    code_verifier, code_challenge = generate_pkce_pair()
+    assert not verify_pkce(code_verifier, code_challenge + "=")
+    assert not verify_pkce(code_verifier, code_challenge[:-1])